@@ -1,17 +1,66 @@
-from flask import Flask
+from flask import Flask, current_app, jsonify
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
+from sqlalchemy import event
+from werkzeug.exceptions import BadRequest, HTTPException
+from app.json_provider import ORJSONProvider
 
 db = SQLAlchemy()
 
-def create_app():
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Enable WAL and related pragmas on every new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+SECURITY_HEADERS = (
+    ('X-Content-Type-Options', 'nosniff'),
+    ('X-Frame-Options', 'DENY'),
+    ('X-XSS-Protection', '1; mode=block'),
+    ('Strict-Transport-Security', 'max-age=31536000; includeSubDomains'),
+    ('Content-Security-Policy', "default-src 'self'")
+)
+
+def add_security_headers(response):
+    """Add security headers to all responses"""
+    response.headers.extend(SECURITY_HEADERS)
+    return response
+
+def handle_bad_request(error):
+    """Handle validation errors"""
+    return jsonify({'error': str(error.description)}), 400
+
+def handle_error(error):
+    """Handle unexpected errors"""
+    if isinstance(error, HTTPException):
+        return error  # Keep 404/405 responses as they are
+    current_app.logger.error(f"Unexpected error: {str(error)}")
+    return jsonify({'error': 'Internal server error'}), 500
+
+def create_app(config_object='app.config.Config'):
     app = Flask(__name__)
-    app.config.from_object('app.config.Config')
+    app.json = ORJSONProvider(app)
+    app.config.from_object(config_object)
+    # Match /accounts and /accounts/ without a redirect round trip
+    app.url_map.strict_slashes = False
     
     db.init_app(app)
     CORS(app)
     
-    from app.routes import accounts_bp
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, 'connect', set_sqlite_pragmas)
+    
+    app.after_request(add_security_headers)
+    app.register_error_handler(BadRequest, handle_bad_request)
+    app.register_error_handler(Exception, handle_error)
+    
+    from app.routes import main_bp, accounts_bp
+    app.register_blueprint(main_bp)
     app.register_blueprint(accounts_bp)
     
     with app.app_context():
@@ -1,7 +1,36 @@
 import os
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
+
+def engine_options(database_uri):
+    """Build SQLAlchemy engine options suited to the database URI"""
+    url = make_url(database_uri)
+    # Keep connections open across requests instead of reopening the database each time
+    options = {
+        'pool_pre_ping': True,
+        'pool_recycle': 1800
+    }
+    if url.get_backend_name() == 'sqlite':
+        # Pooled SQLite connections are handed between request threads
+        options['connect_args'] = {'check_same_thread': False}
+    if url.get_backend_name() != 'sqlite' or url.database not in (None, '', ':memory:'):
+        # In-memory SQLite gets a StaticPool from Flask-SQLAlchemy, which rejects queue sizing
+        options.update(pool_size=10, max_overflow=20)
+    return options
 
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-2024'
+    # SQLite or PostgreSQL: account inserts rely on INSERT ... ON CONFLICT DO NOTHING
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///accounts.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    DEBUG = True
\ No newline at end of file
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+    DEBUG = os.environ.get('FLASK_DEBUG', '0') == '1'
+
+class TestingConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    # One shared connection keeps the in-memory schema visible to every session and thread
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': StaticPool,
+        'connect_args': {'check_same_thread': False}
+    }
\ No newline at end of file
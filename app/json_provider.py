@@ -0,0 +1,22 @@
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson (handles datetime natively)"""
+
+    # The orjson overrides below never indent or sort keys, even in debug mode
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build jsonify() responses from orjson bytes, skipping the str round trip"""
+        # Same argument handling as jsonify(), without Flask's private _prepare_response_obj
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        obj = args[0] if len(args) == 1 else (args or kwargs or None)
+        return self._app.response_class(orjson.dumps(obj, option=self.option), mimetype=self.mimetype)
\ No newline at end of file
@@ -1,23 +1,30 @@
+from operator import attrgetter
 from app import db
-from datetime import datetime
+from app.validators import sanitize_input
 
 class Account(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
-    email = db.Column(db.String(120), unique=True, nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False, index=True)
     phone = db.Column(db.String(20), nullable=True)
-    date_joined = db.Column(db.DateTime, default=datetime.utcnow)
+    date_joined = db.Column(db.DateTime, server_default=db.func.current_timestamp(), nullable=False)
     
     def to_dict(self):
+        account_id, name, email, phone, date_joined = ACCOUNT_FIELDS(self)
         return {
-            'id': self.id,
-            'name': self.name,
-            'email': self.email,
-            'phone': self.phone,
-            'date_joined': self.date_joined.isoformat() if self.date_joined else None
+            'id': account_id,
+            'name': name,
+            'email': email,
+            'phone': phone,
+            'date_joined': date_joined
         }
     
     def from_dict(self, data):
         for field in ['name', 'email', 'phone']:
             if field in data:
-                setattr(self, field, data[field])
\ No newline at end of file
+                # Sanitize input data
+                value = sanitize_input(data[field]) if isinstance(data[field], str) else data[field]
+                setattr(self, field, value)
+
+# Reads all serialized columns in one C-level call
+ACCOUNT_FIELDS = attrgetter('id', 'name', 'email', 'phone', 'date_joined')
\ No newline at end of file
@@ -1,74 +1,186 @@
-from flask import Blueprint, request, jsonify
+import time
+import orjson
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload
+from werkzeug.exceptions import BadRequest
 from app import db
 from app.models import Account
+from app.validators import sanitize_input, validate_account_data
 
+main_bp = Blueprint('main', __name__)
 accounts_bp = Blueprint('accounts', __name__, url_prefix='/api/v1')
 
+# Pagination bounds for list_accounts
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+# Rows fetched per round trip when streaming NDJSON
+STREAM_BATCH_SIZE = 500
+# Largest number of accounts accepted by one bulk create request
+MAX_BULK_SIZE = 1000
+# Dialect INSERT constructs that support ON CONFLICT DO NOTHING ... RETURNING
+INSERT_CONSTRUCTS = {'sqlite': sqlite_insert, 'postgresql': postgresql_insert}
+
+def insert_skipping_duplicates():
+    """INSERT into account that turns rows with an existing email into no-ops"""
+    insert = INSERT_CONSTRUCTS[db.engine.dialect.name]
+    return insert(Account).on_conflict_do_nothing(index_elements=['email'])
+
+@main_bp.route('/')
+def home():
+    return jsonify({"message": "Account Management API is running!", "status": "ok"})
+
+# Successful health checks are reused for this many seconds
+HEALTH_CACHE_TTL = 1.0
+health_cache = {'checked_at': float('-inf')}
+
 @accounts_bp.route('/health', methods=['GET'])
 def health_check():
-    return jsonify({'status': 'healthy', 'service': 'account-management-api'}), 200
+    healthy = {"status": "healthy", "service": "account-management-api", "database": "connected"}
+    if time.monotonic() - health_cache['checked_at'] < HEALTH_CACHE_TTL:
+        return jsonify(healthy)
+    try:
+        # Test database connection - SQLAlchemy 2.0 compatible
+        db.session.execute(db.text('SELECT 1'))
+        health_cache['checked_at'] = time.monotonic()
+        return jsonify(healthy)
+    except Exception as e:
+        current_app.logger.error(f"Health check failed: {str(e)}")
+        return jsonify({"status": "unhealthy", "service": "account-management-api", "database": "unavailable"}), 500
 
 @accounts_bp.route('/accounts', methods=['POST'])
 def create_account():
     try:
         data = request.get_json()
-        if not data or 'name' not in data or 'email' not in data:
-            return jsonify({'error': 'Name and email are required'}), 400
         
-        # Check if email already exists
-        existing = Account.query.filter_by(email=data['email']).first()
-        if existing:
-            return jsonify({'error': 'Email already exists'}), 409
+        # Reject malformed requests before touching the database
+        if not isinstance(data, dict) or 'name' not in data or 'email' not in data:
+            return jsonify({'error': 'Name and email are required'}), 400
+        validate_account_data(data)
         
         account = Account()
         account.from_dict(data)
-        db.session.add(account)
+        
+        # Insert in one statement; the unique email index turns duplicates into no-ops
+        account = db.session.scalars(
+            insert_skipping_duplicates()
+            .values(name=account.name, email=account.email, phone=account.phone)
+            .returning(Account)
+        ).first()
+        if account is None:
+            db.session.rollback()
+            return jsonify({'error': 'Email already exists'}), 409
+        # Serialize before commit so the expired instance is not reloaded
+        body = account.to_dict()
         db.session.commit()
         
-        return jsonify(account.to_dict()), 201
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return jsonify(body), 201
+    except BadRequest:
+        raise  # Re-raise validation errors
+    except Exception:
+        db.session.rollback()
+        raise  # handle_error logs it and answers with a generic 500
+
+@accounts_bp.route('/accounts/bulk', methods=['POST'])
+def bulk_create_accounts():
+    try:
+        data = request.get_json()
+        if not isinstance(data, list) or not data:
+            raise BadRequest("Expected a non-empty list of accounts")
+        if len(data) > MAX_BULK_SIZE:
+            raise BadRequest(f"At most {MAX_BULK_SIZE} accounts per request")
+        
+        rows = []
+        for item in data:
+            if not isinstance(item, dict) or 'name' not in item or 'email' not in item:
+                raise BadRequest("Name and email are required")
+            validate_account_data(item)
+            rows.append({field: sanitize_input(item.get(field)) for field in ('name', 'email', 'phone')})
+        
+        # One executemany-style INSERT and a single commit; duplicate emails are skipped
+        inserted = db.session.execute(
+            insert_skipping_duplicates().returning(Account.id),
+            rows
+        ).all()
+        db.session.commit()
+        
+        return jsonify({'inserted': len(inserted)}), 201
+    except BadRequest:
+        raise  # Re-raise validation errors
+    except Exception:
+        db.session.rollback()
+        raise  # handle_error logs it and answers with a generic 500
 
 @accounts_bp.route('/accounts/<int:account_id>', methods=['GET'])
 def get_account(account_id):
-    try:
-        account = Account.query.get(account_id)
-        if not account:
-            return jsonify({'error': 'Account not found'}), 404
-        return jsonify(account.to_dict()), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    # raiseload('*') makes any lazy load in to_dict fail loudly instead of issuing N+1 queries
+    account = db.session.get(Account, account_id, options=[raiseload('*')])
+    if not account:
+        return jsonify({'error': 'Account not found'}), 404
+    return jsonify(account.to_dict())
+
+def stream_accounts():
+    """Yield every account as one NDJSON line, fetching rows in batches"""
+    rows = db.session.execute(
+        db.select(Account.id, Account.name, Account.email, Account.phone, Account.date_joined)
+        .order_by(Account.id)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    ).mappings()
+    for row in rows:
+        yield orjson.dumps(dict(row)) + b'\n'
 
 @accounts_bp.route('/accounts', methods=['GET'])
 def list_accounts():
-    try:
-        accounts = Account.query.all()
-        return jsonify([account.to_dict() for account in accounts]), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    if request.accept_mimetypes.best == 'application/x-ndjson':
+        return Response(stream_with_context(stream_accounts()), mimetype='application/x-ndjson')
+
+    limit = min(max(request.args.get('limit', DEFAULT_PAGE_SIZE, type=int), 1), MAX_PAGE_SIZE)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+
+    # Plain column rows skip ORM hydration and per-row to_dict calls
+    rows = db.session.execute(
+        db.select(Account.id, Account.name, Account.email, Account.phone, Account.date_joined)
+        .order_by(Account.id)
+        .limit(limit)
+        .offset(offset)
+    ).mappings().all()
+    return jsonify({
+        'items': [dict(row) for row in rows],
+        'next_offset': offset + limit if len(rows) == limit else None
+    })
 
 @accounts_bp.route('/accounts/<int:account_id>', methods=['PUT'])
 def update_account(account_id):
     try:
-        account = Account.query.get(account_id)
+        account = db.session.get(Account, account_id)
         if not account:
             return jsonify({'error': 'Account not found'}), 404
         
         data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
+        
+        # Security validation
+        validate_account_data(data)
         
         account.from_dict(data)
         db.session.commit()
         
         return jsonify(account.to_dict()), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    except BadRequest:
+        raise  # Re-raise validation errors
+    except IntegrityError:
+        # email is the only unique column
+        db.session.rollback()
+        return jsonify({'error': 'Email already exists'}), 409
+    except Exception:
+        db.session.rollback()
+        raise  # handle_error logs it and answers with a generic 500
 
 @accounts_bp.route('/accounts/<int:account_id>', methods=['DELETE'])
 def delete_account(account_id):
     try:
-        account = Account.query.get(account_id)
+        account = db.session.get(Account, account_id)
         if not account:
             return jsonify({'error': 'Account not found'}), 404
         
@@ -76,5 +188,6 @@ def delete_account(account_id):
         db.session.commit()
         
         return jsonify({'message': 'Account deleted successfully'}), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+    except Exception:
+        db.session.rollback()
+        raise  # handle_error logs it and answers with a generic 500
\ No newline at end of file
@@ -0,0 +1,50 @@
+import re
+from werkzeug.exceptions import BadRequest
+
+# Input validation functions
+NAME_MAX_LENGTH = 100
+EMAIL_MAX_LENGTH = 120
+PHONE_MAX_LENGTH = 20
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+def validate_email(email):
+    """Validate email format"""
+    return EMAIL_RE.match(email) is not None
+
+XSS_TABLE = str.maketrans({'<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+def sanitize_input(data):
+    """Sanitize input data to prevent XSS"""
+    if isinstance(data, str):
+        data = data.translate(XSS_TABLE)
+    return data
+
+def validate_account_data(data):
+    """Validate account data"""
+    if not data:
+        raise BadRequest("No data provided")
+    if not isinstance(data, dict):
+        raise BadRequest("Expected a JSON object")
+    
+    if 'email' in data:
+        email = data['email']
+        if not isinstance(email, str) or not validate_email(email):
+            raise BadRequest("Invalid email format")
+        if len(email) > EMAIL_MAX_LENGTH:
+            raise BadRequest(f"Email must be at most {EMAIL_MAX_LENGTH} characters long")
+    
+    if 'name' in data:
+        name = data['name']
+        if not isinstance(name, str) or len(name.strip()) < 2:
+            raise BadRequest("Name must be at least 2 characters long")
+        if len(name) > NAME_MAX_LENGTH:
+            raise BadRequest(f"Name must be at most {NAME_MAX_LENGTH} characters long")
+    
+    phone = data.get('phone')
+    if phone is not None:
+        if not isinstance(phone, str):
+            raise BadRequest("Phone must be a string")
+        if len(phone) > PHONE_MAX_LENGTH:
+            raise BadRequest(f"Phone must be at most {PHONE_MAX_LENGTH} characters long")
+    
+    return True
\ No newline at end of file
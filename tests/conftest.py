@@ -0,0 +1,74 @@
+import pytest
+from uuid import uuid4
+from sqlalchemy import event
+from sqlalchemy.orm import configure_mappers
+from app import create_app, db
+from app.models import Account
+
+@pytest.fixture(scope='session')
+def _app():
+    app = create_app('app.config.TestingConfig')
+    
+    with app.app_context():
+        # pysqlite only emits BEGIN before DML; SAVEPOINTs need real transactions
+        with db.engine.connect() as connection:
+            connection.connection.driver_connection.isolation_level = None
+        event.listen(db.engine, 'begin', lambda connection: connection.exec_driver_sql('BEGIN'))
+        # Pay mapper configuration and URL matcher compilation before the first test, not inside it
+        configure_mappers()
+        app.url_map.update()
+        yield app
+
+@pytest.fixture(scope='session')
+def _client(_app):
+    # The test client holds no database state, so one instance serves every test
+    return _app.test_client()
+
+@pytest.fixture
+def db_transaction(_app):
+    # Run each test inside an outer transaction that is rolled back afterwards;
+    # commits in the app only release SAVEPOINTs, so no DDL runs between tests
+    db.session.remove()
+    engines = db.engines
+    engine = engines[None]
+    connection = engine.connect()
+    transaction = connection.begin()
+    engines[None] = connection
+    db.session.configure(join_transaction_mode='create_savepoint')
+    
+    try:
+        yield connection
+    finally:
+        db.session.remove()
+        engines[None] = engine
+        transaction.rollback()
+        connection.close()
+
+@pytest.fixture
+def client(_client, db_transaction):
+    return _client
+
+@pytest.fixture
+def ro_client(_client):
+    # For tests that never write: no per-test connection or transaction setup
+    return _client
+
+@pytest.fixture
+def seeded_accounts(client):
+    # Insert directly through the ORM in one commit instead of one POST per account
+    accounts = [Account(name=f'User {i}', email=f'user{i}@example.com') for i in range(3)]
+    db.session.add_all(accounts)
+    # Not flush(): under create_savepoint a route's rollback() would discard unreleased seed rows
+    db.session.commit()
+    return accounts
+
+@pytest.fixture
+def make_account(client):
+    def _make_account(**fields):
+        account = Account(**{'name': 'Test User', 'email': f'user-{uuid4().hex}@example.com', **fields})
+        db.session.add(account)
+        # commit() only releases the savepoint, so a route's rollback cannot undo the seed;
+        # the outer transaction still discards it when the test ends
+        db.session.commit()
+        return account.id
+    return _make_account
\ No newline at end of file
@@ -0,0 +1,5 @@
+HEALTH_URL = '/api/v1/health'
+ACCOUNTS_URL = '/api/v1/accounts'
+
+def account_url(account_id):
+    return f'{ACCOUNTS_URL}/{account_id}'
@@ -1,101 +1,212 @@
 import pytest
-import json
-import sys
-import os
-
-# Fix for Werkzeug version issue in GitHub Actions
-import werkzeug
-if not hasattr(werkzeug, '__version__'):
-    werkzeug.__version__ = '2.3.7'
-
-# Import from your single app.py file directly
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-# Import the single app.py module (not the app package)
-import importlib.util
-app_py_path = os.path.join(os.path.dirname(__file__), '..', 'app.py')
-spec = importlib.util.spec_from_file_location("app_module", app_py_path)
-app_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(app_module)
-
-@pytest.fixture
-def client():
-    app_module.app.config['TESTING'] = True
-    app_module.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-    
-    with app_module.app.test_client() as client:
-        with app_module.app.app_context():
-            app_module.db.create_all()
-            yield client
-            app_module.db.drop_all()
-
-def test_health_check(client):
-    response = client.get('/api/v1/health')
-    assert response.status_code == 200
-    data = json.loads(response.data)
-    assert data['status'] == 'healthy'
-    assert data['service'] == 'account-management-api'
-    # Database connection should also be tested
-    assert 'database' in data
+from orjson import dumps, loads
+from datetime import datetime
+from types import MappingProxyType
+
+from app import db, routes
+from tests.helpers import ACCOUNTS_URL, HEALTH_URL, account_url
+
+def fail(message):
+    """Return a stand-in that raises Exception(message) when called"""
+    def _raise(*args, **kwargs):
+        raise Exception(message)
+    return _raise
+
+# Read-only field sets for tests that derive variants from them
+FRANK_FIELDS = MappingProxyType({'name': 'Frank Green', 'email': 'frank@example.com'})
+LENA_FIELDS = MappingProxyType({'name': 'Lena Ortiz', 'email': 'lena@example.com'})
+
+# Fixed request bodies, encoded once at import time
+JOHN_DOE = dumps({'name': 'John Doe', 'email': 'john@example.com', 'phone': '123-456-7890'})
+ROBERT_SMITH_UPDATE = dumps({'name': 'Robert Smith', 'phone': '555-0123'})
+DANA_WHITE = dumps({'name': 'Dana White', 'email': 'dana@example.com'})
+EVE_ADAMS = dumps({'name': 'Eve Adams', 'email': 'eve@example.com', 'phone': '555-0100'})
+FRANK_GREEN = dumps(dict(FRANK_FIELDS))
+GINA_MARKUP = dumps({'name': '<b>"Gina"</b>', 'email': 'gina@example.com'})
+BULK_WITH_DUPLICATE = dumps([
+    {'name': 'Hana Lee', 'email': 'hana@example.com'},
+    {'name': 'Ivan Petrov', 'email': 'ivan@example.com', 'phone': '555-0199'},
+    {'name': 'Hana Again', 'email': 'hana@example.com'}
+])
+BULK_MISSING_EMAIL = dumps([{'name': 'Jon Snow', 'email': 'jon@example.com'}, {'name': 'No Email'}])
+BULK_LIST_PHONE = dumps([{'name': 'Jon Snow', 'email': 'jon@example.com', 'phone': [1]}])
 
 def test_create_account(client):
-    account_data = {
-        'name': 'John Doe',
-        'email': 'john@example.com',
-        'phone': '123-456-7890'
-    }
-    response = client.post('/api/v1/accounts',
-                          json=account_data,
-                          content_type='application/json')
+    response = client.post(ACCOUNTS_URL, data=JOHN_DOE, content_type='application/json')
     assert response.status_code == 201
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data['name'] == 'John Doe'
     assert data['email'] == 'john@example.com'
 
-def test_get_account(client):
+def test_get_account(client, make_account):
     # First create an account
-    account_data = {'name': 'Jane Doe', 'email': 'jane@example.com'}
-    create_response = client.post('/api/v1/accounts', json=account_data)
-    account_id = json.loads(create_response.data)['id']
+    account_id = make_account(name='Jane Doe', email='jane@example.com')
     
     # Then get it
-    response = client.get(f'/api/v1/accounts/{account_id}')
+    response = client.get(account_url(account_id))
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data['name'] == 'Jane Doe'
 
-def test_list_accounts(client):
-    response = client.get('/api/v1/accounts')
-    assert response.status_code == 200
-    data = json.loads(response.data)
-    assert isinstance(data, list)
-
-def test_update_account(client):
+def test_update_account(client, make_account):
     # Create account
-    account_data = {'name': 'Bob Smith', 'email': 'bob@example.com'}
-    create_response = client.post('/api/v1/accounts', json=account_data)
-    account_id = json.loads(create_response.data)['id']
+    account_id = make_account(name='Bob Smith', email='bob@example.com')
     
     # Update account
-    update_data = {'name': 'Robert Smith', 'phone': '555-0123'}
-    response = client.put(f'/api/v1/accounts/{account_id}', json=update_data)
+    response = client.put(account_url(account_id), data=ROBERT_SMITH_UPDATE, content_type='application/json')
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data['name'] == 'Robert Smith'
     assert data['phone'] == '555-0123'
 
-def test_delete_account(client):
+def test_delete_account(client, make_account):
     # Create account
-    account_data = {'name': 'Alice Brown', 'email': 'alice@example.com'}
-    create_response = client.post('/api/v1/accounts', json=account_data)
-    account_id = json.loads(create_response.data)['id']
+    account_id = make_account(name='Alice Brown', email='alice@example.com')
     
     # Delete account
-    response = client.delete(f'/api/v1/accounts/{account_id}')
+    response = client.delete(account_url(account_id))
     assert response.status_code == 200
     
     # Verify deletion
-    get_response = client.get(f'/api/v1/accounts/{account_id}')
-    assert get_response.status_code == 404
\ No newline at end of file
+    get_response = client.get(account_url(account_id))
+    assert get_response.status_code == 404
+
+def test_date_joined_serialized_as_iso(client):
+    response = client.post(ACCOUNTS_URL, data=DANA_WHITE, content_type='application/json')
+    assert response.status_code == 201
+    data = response.get_json()
+    # orjson emits naive datetimes in the same format as isoformat()
+    assert datetime.fromisoformat(data['date_joined'])
+
+def test_list_accounts_returns_all_fields(client):
+    client.post(ACCOUNTS_URL, data=EVE_ADAMS, content_type='application/json')
+
+    response = client.get(ACCOUNTS_URL)
+    assert response.status_code == 200
+    items = response.get_json()['items']
+    assert len(items) == 1
+    assert set(items[0]) == {'id', 'name', 'email', 'phone', 'date_joined'}
+    assert items[0]['email'] == 'eve@example.com'
+
+def test_list_accounts_pagination(client, seeded_accounts):
+    response = client.get(f'{ACCOUNTS_URL}?limit=2')
+    data = response.get_json()
+    assert [item['name'] for item in data['items']] == ['User 0', 'User 1']
+    assert data['next_offset'] == 2
+
+    response = client.get(f'{ACCOUNTS_URL}?limit=2&offset=2')
+    data = response.get_json()
+    assert [item['name'] for item in data['items']] == ['User 2']
+    assert data['next_offset'] is None
+
+def test_create_account_duplicate_email(client):
+    response = client.post(ACCOUNTS_URL, data=FRANK_GREEN, content_type='application/json')
+    assert response.status_code == 201
+
+    duplicate = dumps({**FRANK_FIELDS, 'name': 'Other Frank'})
+    response = client.post(ACCOUNTS_URL, data=duplicate, content_type='application/json')
+    assert response.status_code == 409
+    assert response.get_json()['error'] == 'Email already exists'
+
+def test_create_account_sanitizes_markup(client):
+    response = client.post(ACCOUNTS_URL, data=GINA_MARKUP, content_type='application/json')
+    assert response.status_code == 201
+    data = response.get_json()
+    assert data['name'] == '&lt;b&gt;&quot;Gina&quot;&lt;/b&gt;'
+
+def test_health_check_cached(client, monkeypatch):
+    routes.health_cache['checked_at'] = float('-inf')
+    assert client.get(HEALTH_URL).status_code == 200
+
+    # A failing database is not noticed until the cached result expires
+    monkeypatch.setattr(db.session, 'execute', fail('db down'))
+    assert client.get(HEALTH_URL).status_code == 200
+    routes.health_cache['checked_at'] = float('-inf')
+    response = client.get(HEALTH_URL)
+    monkeypatch.undo()
+    assert response.status_code == 500
+    assert response.get_json() == {'status': 'unhealthy', 'service': 'account-management-api', 'database': 'unavailable'}
+
+def test_list_accounts_ndjson_stream(client, seeded_accounts):
+    response = client.get(ACCOUNTS_URL, headers={'Accept': 'application/x-ndjson'})
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    lines = response.data.splitlines()
+    assert [loads(line)['name'] for line in lines] == ['User 0', 'User 1', 'User 2']
+
+def test_bulk_create_accounts(client):
+    response = client.post(f'{ACCOUNTS_URL}/bulk', data=BULK_WITH_DUPLICATE, content_type='application/json')
+    assert response.status_code == 201
+    assert response.get_json() == {'inserted': 2}
+
+    items = client.get(ACCOUNTS_URL).get_json()['items']
+    assert [item['email'] for item in items] == ['hana@example.com', 'ivan@example.com']
+
+@pytest.mark.parametrize('body', [BULK_MISSING_EMAIL, BULK_LIST_PHONE], ids=['missing_email', 'list_phone'])
+def test_bulk_create_accounts_rejects_invalid_item(client, body):
+    response = client.post(f'{ACCOUNTS_URL}/bulk', data=body, content_type='application/json')
+    assert response.status_code == 400
+    assert client.get(ACCOUNTS_URL).get_json()['items'] == []
+
+@pytest.mark.parametrize('payload,error', [
+    (dumps({'name': '', 'email': ''}), 'Invalid email format'),
+    (dumps({'name': None, 'email': 'test@example.com'}), 'Name must be at least 2 characters long'),
+    (dumps({'name': 'Test User', 'email': None}), 'Invalid email format'),
+    (dumps({'name': 'A' * 200, 'email': 'test@example.com'}), 'Name must be at most 100 characters long'),
+    (dumps({'name': 'Test User', 'email': 'a' * 110 + '@example.com'}), 'Email must be at most 120 characters long'),
+    (dumps({'name': 'Test User', 'email': 'test@example.com', 'phone': {'number': 1}}), 'Phone must be a string'),
+    (dumps({'name': 'Test User', 'email': 'test@example.com', 'phone': '5' * 50}), 'Phone must be at most 20 characters long')
+], ids=['empty', 'null_name', 'null_email', 'long_name', 'long_email', 'dict_phone', 'long_phone'])
+def test_create_account_invalid_payloads(client, payload, error):
+    response = client.post(ACCOUNTS_URL, data=payload, content_type='application/json')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == error
+    assert client.get(ACCOUNTS_URL).get_json()['items'] == []
+
+@pytest.mark.parametrize('method,url,payload,needs_account', [
+    ('post', ACCOUNTS_URL, dumps(dict(LENA_FIELDS)), False),
+    ('put', ACCOUNTS_URL + '/{id}', dumps({'name': LENA_FIELDS['name']}), True),
+    ('delete', ACCOUNTS_URL + '/{id}', None, True)
+])
+def test_database_error_rolls_back(client, make_account, monkeypatch, method, url, payload, needs_account):
+    if needs_account:
+        url = url.format(id=make_account())
+    monkeypatch.setattr(db.session, 'commit', fail('Database error'))
+    response = getattr(client, method)(url, data=payload, content_type='application/json')
+    monkeypatch.undo()
+    assert response.status_code == 500
+    # The exception text stays in the log, not the response
+    assert response.get_json()['error'] == 'Internal server error'
+
+    # Nothing the failed request staged survives: no new row, no rename, no deletion
+    names = [item['name'] for item in client.get(ACCOUNTS_URL).get_json()['items']]
+    assert names == (['Test User'] if needs_account else [])
+    if needs_account:
+        assert client.get(url).status_code == 200
+
+def test_update_account_rejects_non_object_body(client, make_account):
+    response = client.put(account_url(make_account()), data=dumps('name email'), content_type='application/json')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Expected a JSON object'
+
+def test_update_account_duplicate_email(client, make_account):
+    make_account(email=FRANK_FIELDS['email'])
+    account_id = make_account(name='Lena Ortiz', email=LENA_FIELDS['email'])
+
+    # The unique index rejects the change, so no mocking is needed to reach the rollback
+    response = client.put(account_url(account_id), data=FRANK_GREEN, content_type='application/json')
+    assert response.status_code == 409
+    assert response.get_json()['error'] == 'Email already exists'
+
+    data = client.get(account_url(account_id)).get_json()
+    assert (data['name'], data['email']) == ('Lena Ortiz', LENA_FIELDS['email'])
+
+def test_multiple_operations_sequence(client, seeded_accounts):
+    first, second, third = (account.id for account in seeded_accounts)
+
+    response = client.put(account_url(first), data=ROBERT_SMITH_UPDATE, content_type='application/json')
+    assert response.status_code == 200
+    assert client.delete(account_url(second)).status_code == 200
+
+    items = client.get(ACCOUNTS_URL).get_json()['items']
+    assert [(item['id'], item['name']) for item in items] == [(first, 'Robert Smith'), (third, 'User 2')]
\ No newline at end of file
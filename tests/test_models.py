@@ -0,0 +1,29 @@
+from datetime import datetime
+from app.models import Account
+
+# Model helpers need no app context or database, so these tests take no fixtures
+
+def test_account_to_dict():
+    joined = datetime(2024, 1, 2, 3, 4, 5)
+    account = Account(id=7, name='John Doe', email='john@example.com', phone='123', date_joined=joined)
+    assert account.to_dict() == {
+        'id': 7,
+        'name': 'John Doe',
+        'email': 'john@example.com',
+        'phone': '123',
+        'date_joined': joined
+    }
+
+def test_account_from_dict():
+    account = Account()
+    account.from_dict({'name': '<i>Jane</i>', 'email': 'jane@example.com', 'phone': None, 'id': 99})
+    assert account.name == '&lt;i&gt;Jane&lt;/i&gt;'
+    assert account.email == 'jane@example.com'
+    assert account.phone is None
+    assert account.id is None
+
+def test_account_from_dict_partial():
+    account = Account(name='Bob Smith', email='bob@example.com')
+    account.from_dict({'phone': '555-0123'})
+    assert account.name == 'Bob Smith'
+    assert account.phone == '555-0123'
\ No newline at end of file
@@ -0,0 +1,81 @@
+import pytest
+from orjson import dumps
+
+from app.json_provider import ORJSONProvider
+from tests.helpers import ACCOUNTS_URL, HEALTH_URL, account_url
+
+NAME_ONLY = dumps({'name': 'Only Name'})
+INVALID_EMAIL = dumps({'name': 'Kim Park', 'email': 'not-an-email'})
+NOBODY = dumps({'name': 'Nobody'})
+STRING_BODY = dumps('name email')
+
+@pytest.mark.parametrize('method,path', [
+    ('get', account_url('invalid_id')),
+    ('put', account_url('invalid_id')),
+    ('delete', account_url('invalid_id')),
+    ('get', account_url(0)),
+    ('get', account_url(-1)),
+    ('get', account_url(999999999)),
+    ('put', account_url(999999999)),
+    ('delete', account_url(999999999))
+])
+def test_account_not_found(ro_client, method, path):
+    response = getattr(ro_client, method)(path, data=NOBODY if method == 'put' else None, content_type='application/json')
+    assert response.status_code == 404
+
+def test_health_check(ro_client):
+    response = ro_client.get(HEALTH_URL)
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['status'] == 'healthy'
+    assert data['service'] == 'account-management-api'
+    # Database connection should also be tested
+    assert 'database' in data
+
+def test_list_accounts(ro_client):
+    response = ro_client.get(ACCOUNTS_URL)
+    assert response.status_code == 200
+    data = response.get_json()
+    assert isinstance(data['items'], list)
+    assert data['next_offset'] is None
+
+def test_responses_use_orjson_provider(ro_client):
+    assert isinstance(ro_client.application.json, ORJSONProvider)
+    # orjson output is compact: no spaces after separators
+    assert ro_client.get(ACCOUNTS_URL).data == b'{"items":[],"next_offset":null}'
+
+@pytest.mark.parametrize('path,status,is_json', [
+    ('/', 200, True),
+    (HEALTH_URL, 200, True),
+    (ACCOUNTS_URL, 200, True),
+    # Trailing slashes are served directly rather than redirected
+    (f'{ACCOUNTS_URL}/', 200, True),
+    # Routes are case sensitive
+    (ACCOUNTS_URL.upper(), 404, False),
+    ('/api/v1/unknown', 404, False)
+])
+def test_endpoint_smoke(ro_client, path, status, is_json):
+    response = ro_client.get(path)
+    assert response.status_code == status
+    assert response.is_json == is_json
+    assert response.headers['X-Content-Type-Options'] == 'nosniff'
+
+def test_security_headers(ro_client):
+    response = ro_client.get('/')
+    assert response.headers['X-Frame-Options'] == 'DENY'
+    assert response.headers['Content-Security-Policy'] == "default-src 'self'"
+    assert len(response.headers.getlist('X-Content-Type-Options')) == 1
+
+def test_create_account_missing_fields(ro_client):
+    response = ro_client.post(ACCOUNTS_URL, data=NAME_ONLY, content_type='application/json')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Name and email are required'
+
+    # A JSON string contains 'name' and 'email' as substrings but is not an object
+    response = ro_client.post(ACCOUNTS_URL, data=STRING_BODY, content_type='application/json')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Name and email are required'
+
+    response = ro_client.post(ACCOUNTS_URL, data=INVALID_EMAIL, content_type='application/json')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Invalid email format'
\ No newline at end of file